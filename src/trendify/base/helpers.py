@@ -10,7 +10,7 @@ import logging
 from enum import StrEnum
 from typing import TYPE_CHECKING, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
     from trendify.base.record import Record
@@ -48,8 +48,16 @@ List of tags
 class HashableBase(BaseModel):
     """
     Defines a base for hashable pydantic data classes so that they can be reduced to a minimal set through type-casting.
+
+    Frozen: these are small style values (`Pen`, `Marker`, `HistogramStyle`, ...) that get
+    deduplicated in sets and shared between many records, so an instance's hash must never
+    change out from under a set it's already in. Subclasses' own `model_config` merges with
+    this one, so they stay frozen without repeating it. Callers that want a changed style
+    derive one with `model_copy(update=...)`; assigning a field raises a `ValidationError`.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     def __hash__(self):
         """
         Defines hash function
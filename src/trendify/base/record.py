@@ -6,6 +6,7 @@ implements against, and the subclass registry `RecordStore` uses to deserialize
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import Callable
 from pathlib import Path
@@ -14,6 +15,7 @@ from typing import Any
 from pydantic import (
     BaseModel,
     ConfigDict,
+    Field,
     InstanceOf,
     SerializeAsAny,
     computed_field,
@@ -29,6 +31,18 @@ __all__ = ["Record", "RecordGenerator", "RecordList"]
 _record_subclass_registry: dict[str, type[Record]] = {}
 
 
+@functools.cache
+def _leaf_type_names(object_type: type[Record]) -> tuple[str, ...]:
+    # Cached per `object_type`: every filtered store query expands its type this way, and
+    # the answer only changes when a new subclass registers (`Record.__init_subclass__`
+    # clears the cache when that happens).
+    return tuple(
+        name
+        for name, cls in _record_subclass_registry.items()
+        if issubclass(cls, object_type)
+    )
+
+
 class Record(BaseModel):
     """
     Base class for records to be generated and handled.
@@ -37,7 +51,9 @@ class Record(BaseModel):
     tags: Tags
     """Tags to be used for sorting data."""
 
-    metadata: dict[str, str] = {}
+    # `default_factory` rather than a `{}` default: pydantic would otherwise run its
+    # mutable-default copy logic for every record built without metadata, which is most of them.
+    metadata: dict[str, str] = Field(default_factory=dict)
     """A dictionary of metadata to be used as a tool tip for mouseover in Grafana."""
 
     @model_validator(mode="before")
@@ -75,6 +91,7 @@ class Record(BaseModel):
         """
         super().__init_subclass__(**kwargs)
         _record_subclass_registry[cls.__name__] = cls
+        _leaf_type_names.cache_clear()
         logger.debug(f"Registered Record subclass {cls.__name__!r}")
 
     model_config = ConfigDict(extra="allow")
@@ -97,13 +114,27 @@ class Record(BaseModel):
     def registry(cls) -> dict[str, type[Record]]:
         """
         Returns:
-            (dict[str, type[Record]]): a copy of the record_type -> class registry,
-                used by the store to resolve which leaf `record_type` names correspond to a
-                given (possibly non-leaf) type when filtering by `object_type`.
+            (dict[str, type[Record]]): a copy of the record_type -> class registry (see
+                `leaf_type_names` for the cached, type-filtered view the store queries use).
 
         """
         return dict(_record_subclass_registry)
 
+    @classmethod
+    def leaf_type_names(cls) -> tuple[str, ...]:
+        """
+        Expands this (possibly non-leaf) `Record` type into the registered leaf
+        `record_type` names that are instances of it: `PlottableData2D`, for example, expands
+        to `("Point2D", "Trace2D", "AxLine", "HistogramEntry", ...)`. This lets tag/type
+        filtering happen as a plain SQL `record_type IN (...)` clause instead of
+        deserializing every tag-matched row just to run an `isinstance` check in Python.
+
+        Returns:
+            (tuple[str, ...]): registered `record_type` names that are subclasses of `cls`
+
+        """
+        return _leaf_type_names(cls)
+
     @classmethod
     def deserialize(cls, record_type: str, payload: str) -> Record:
         """
@@ -126,7 +157,9 @@ class Record(BaseModel):
                 f"defining that subclass hasn't been imported in this process."
             )
             raise
-        return duck_type.model_validate_json(payload)
+        # Straight to the class's compiled pydantic-core validator: `model_validate_json` is a
+        # thin wrapper around this same call, and this runs once per row on every store read.
+        return duck_type.__pydantic_validator__.validate_json(payload)
 
     def set_metadata(self, new: dict[str, str]):
         self.metadata = new
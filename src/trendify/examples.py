@@ -4,6 +4,7 @@ Sample data + a `RecordGenerator` used as a fixture for exercising the `trendify
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from pathlib import Path
 from typing import cast
@@ -38,60 +39,83 @@ def make_example_data(workdir: Path, n_folders: int = 10):
     if not (models_dir / ".gitignore").exists():
         (models_dir / ".gitignore").write_text("*")
 
-    for n in range(n_folders):
-        subdir = models_dir.joinpath(str(n))
-        subdir.mkdir(exist_ok=True, parents=True)
-
-        rng = np.random.default_rng(seed=n)
-
-        n_samples = rng.integers(
-            low=60, high=80
-        )  # Bumped slightly to resolve sharp shapes beautifully
-        t = np.linspace(0, 1, n_samples)
-        amplitudes = rng.uniform(low=0.8, high=1.5, size=3)
-        noise_level = 0.03
-
-        # --- 1. WAVE_1: Damped Harmonic Oscillation ---
-        decay_rate = rng.uniform(1.5, 3.5)
-        freq = rng.uniform(3.0, 5.0)
-        wave_1 = amplitudes[0] * np.sin(2 * np.pi * freq * t) * np.exp(
-            -decay_rate * t
-        ) + noise_level * rng.normal(size=len(t))
-
-        # --- 2. WAVE_2: Sharp Step / Discontinuity ---
-        step_time = rng.uniform(0.3, 0.6)
-        base_level = rng.uniform(-0.2, 0.2)
-        wave_2 = np.where(
-            t < step_time, base_level, base_level + amplitudes[1]
-        ) + noise_level * rng.normal(size=len(t))
-
-        # --- 3. WAVE_3: Logistic Saturation (S-Curve) ---
-        midpoint = rng.uniform(0.4, 0.6)
-        steepness = rng.uniform(10.0, 16.0)
-        wave_3 = amplitudes[2] / (
-            1.0 + np.exp(-steepness * (t - midpoint))
-        ) + noise_level * rng.normal(size=len(t))
-
-        # Collect metadata parameters uniquely for this run to write to stdin.csv
-        inputs: dict[str, int | float] = {
-            "n_samples": int(n_samples),
-            "w1_decay": float(decay_rate),
-            "w1_freq": float(freq),
-            "w2_step_time": float(step_time),
-            "w3_midpoint": float(midpoint),
-        }
-
-        pl.DataFrame(
-            {"key": list(inputs.keys()), "value": [str(v) for v in inputs.values()]}
-        ).write_csv(subdir.joinpath("stdin.csv"), include_header=False)
-
-        # Package channels cleanly matching your original structure
-        data_channels = [t, wave_1, wave_2, wave_3]
-        pl.DataFrame(dict(zip([str(e) for e in ColumnName], data_channels))).write_csv(
-            subdir.joinpath("results.csv")
+    # Each folder seeds its own generator from its index, so building them concurrently
+    # produces the same data as building them in order. The work per folder is small and
+    # mostly file I/O (which releases the GIL), so threads are enough to overlap it.
+    with ThreadPoolExecutor() as executor:
+        list(
+            executor.map(
+                _make_example_folder,
+                (models_dir.joinpath(str(n)) for n in range(n_folders)),
+                range(n_folders),
+            )
         )
 
 
+def _make_example_folder(subdir: Path, seed: int):
+    """
+    Writes one sample run (`stdin.csv` and `results.csv`) to `subdir`.
+
+    Args:
+        subdir (Path): Run directory to create and populate
+        seed (int): Seed for this run's random generator
+
+    """
+    subdir.mkdir(exist_ok=True, parents=True)
+
+    rng = np.random.default_rng(seed=seed)
+
+    n_samples = rng.integers(
+        low=60, high=80
+    )  # Bumped slightly to resolve sharp shapes beautifully
+    t = np.linspace(0, 1, n_samples)
+    amplitudes = rng.uniform(low=0.8, high=1.5, size=3)
+    noise_level = 0.03
+
+    # Every channel lives in one (n_samples, 4) array, one column per `ColumnName`. Each
+    # wave's noise is still drawn right after that wave's own parameters, in the original
+    # order, so a given seed keeps producing the same example data.
+    data = np.empty((n_samples, len(ColumnName)))
+    data[:, 0] = t
+
+    # --- 1. WAVE_1: Damped Harmonic Oscillation ---
+    decay_rate = rng.uniform(1.5, 3.5)
+    freq = rng.uniform(3.0, 5.0)
+    data[:, 1] = amplitudes[0] * np.sin(2 * np.pi * freq * t) * np.exp(-decay_rate * t)
+    data[:, 1] += noise_level * rng.normal(size=n_samples)
+
+    # --- 2. WAVE_2: Sharp Step / Discontinuity ---
+    step_time = rng.uniform(0.3, 0.6)
+    base_level = rng.uniform(-0.2, 0.2)
+    data[:, 2] = np.where(t < step_time, base_level, base_level + amplitudes[1])
+    data[:, 2] += noise_level * rng.normal(size=n_samples)
+
+    # --- 3. WAVE_3: Logistic Saturation (S-Curve) ---
+    midpoint = rng.uniform(0.4, 0.6)
+    steepness = rng.uniform(10.0, 16.0)
+    data[:, 3] = amplitudes[2] / (1.0 + np.exp(-steepness * (t - midpoint)))
+    data[:, 3] += noise_level * rng.normal(size=n_samples)
+
+    # Collect metadata parameters uniquely for this run to write to stdin.csv
+    inputs: dict[str, int | float] = {
+        "n_samples": int(n_samples),
+        "w1_decay": float(decay_rate),
+        "w1_freq": float(freq),
+        "w2_step_time": float(step_time),
+        "w3_midpoint": float(midpoint),
+    }
+
+    # A handful of `key,value` lines with no quoting needed, so format them directly
+    # rather than building a throwaway DataFrame just to serialize it.
+    subdir.joinpath("stdin.csv").write_text(
+        "".join(f"{key},{value}\n" for key, value in inputs.items())
+    )
+
+    pl.DataFrame(data, schema=[str(e) for e in ColumnName], orient="row").write_csv(
+        subdir.joinpath("results.csv")
+    )
+
+
 def transform(data: np.ndarray, scale: trendify.AxisScale) -> np.ndarray:
     if scale == trendify.AxisScale.LINEAR:
         return data
@@ -112,8 +136,15 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
     records = []
 
     df = pl.read_csv(workdir.joinpath("results.csv"))
-    time = df[ColumnName.TIME].to_numpy()
     value_columns = [c for c in df.columns if c != ColumnName.TIME]
+    # Each column feeds several traces below, so the whole (all-float) frame is lifted to one
+    # 2-D array up front and every column is a view into it, rather than converting each
+    # column separately (or once per trace). Polars hands back a column-major array, so each
+    # column view is still contiguous.
+    data = df.to_numpy()
+    columns = {col: data[:, i] for i, col in enumerate(df.columns)}
+    time = columns[ColumnName.TIME]
+    values = {col: columns[col] for col in value_columns}
 
     colors = ["#FF0000", "#000B81", "#FFAA00"]
     alphas = [1.0, 0.3, 1.0]
@@ -127,10 +158,10 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
         scale_x=trendify.AxisScale.LINEAR,
         scale_y=trendify.AxisScale.LINEAR,
     ).append_to_list(records)
-    traces = [
+    for i, col in enumerate(value_columns):
         trendify.Trace2D(
             x=time,
-            y=df[col].to_numpy(),
+            y=values[col],
             tags=[("an_xy_plot", "trace_plot")],
             pen=trendify.Pen(
                 label=col,
@@ -138,11 +169,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
                 linestyle=linestyles[i % len(linestyles)],
                 alpha=alphas[i],
             ),
-        )
-        .append_to_list(records)
-        .set_metadata({"run_num": run_num})
-        for i, col in enumerate(value_columns)
-    ]
+        ).append_to_list(records).set_metadata({"run_num": run_num})
 
     trendify.Format2D(
         tags=[("an_xy_plot", "another_trace_plot")],
@@ -150,10 +177,10 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
         scale_x=trendify.AxisScale.LINEAR,
         scale_y=trendify.AxisScale.LINEAR,
     ).append_to_list(records)
-    traces = [
+    for i, col in enumerate(value_columns):
         trendify.Trace2D(
             x=time,
-            y=df[col].to_numpy(),
+            y=values[col],
             tags=[("an_xy_plot", "another_trace_plot")],
             pen=trendify.Pen(
                 label=col,
@@ -161,11 +188,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
                 linestyle=linestyles[i % len(linestyles)],
                 alpha=alphas[i],
             ),
-        )
-        .append_to_list(records)
-        .set_metadata({"run_num": run_num})
-        for i, col in enumerate(value_columns)
-    ]
+        ).append_to_list(records).set_metadata({"run_num": run_num})
 
     trendify.Format2D(
         tags=[("another_xy_plot", "trace_plot")],
@@ -176,10 +199,10 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
         figure_width=8,
         figure_height=4,
     ).append_to_list(records)
-    traces = [
+    for i, col in enumerate(value_columns):
         trendify.Trace2D(
             x=time,
-            y=df[col].to_numpy(),
+            y=values[col],
             tags=[("another_xy_plot", "trace_plot")],
             pen=trendify.Pen(
                 label=col,
@@ -187,11 +210,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
                 linestyle=linestyles[i % len(linestyles)],
                 alpha=alphas[i],
             ),
-        )
-        .append_to_list(records)
-        .set_metadata({"run_num": run_num})
-        for i, col in enumerate(value_columns)
-    ]
+        ).append_to_list(records).set_metadata({"run_num": run_num})
     trendify.AxLine(
         tags=[("another_xy_plot", "trace_plot")],
         value=0.5,
@@ -216,10 +235,10 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
         scale_x=trendify.AxisScale.LINEAR,
         scale_y=trendify.AxisScale.LOG,
     ).append_to_list(records)
-    traces = [
+    for i, col in enumerate(value_columns):
         trendify.Trace2D(
             x=time,
-            y=transform(df[col].to_numpy(), trendify.AxisScale.LOG),
+            y=transform(values[col], trendify.AxisScale.LOG),
             tags=["trace_plot_log_y"],
             pen=trendify.Pen(
                 label=col,
@@ -227,11 +246,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
                 linestyle=linestyles[i % len(linestyles)],
                 alpha=alphas[i],
             ),
-        )
-        .append_to_list(records)
-        .set_metadata({"run_num": run_num})
-        for i, col in enumerate(value_columns)
-    ]
+        ).append_to_list(records).set_metadata({"run_num": run_num})
 
     trendify.Format2D(
         tags=["trace_plot_log_xy"],
@@ -246,10 +261,10 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
         scale_x=trendify.AxisScale.LOG,
         scale_y=trendify.AxisScale.LOG,
     ).append_to_list(records)
-    traces = [
+    for i, col in enumerate(value_columns):
         trendify.Trace2D(
             x=transform(time, trendify.AxisScale.LOG),
-            y=transform(df[col].to_numpy(), trendify.AxisScale.LOG),
+            y=transform(values[col], trendify.AxisScale.LOG),
             tags=["trace_plot_log_xy"],
             pen=trendify.Pen(
                 label=col,
@@ -259,11 +274,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
                 zorder=[1, 1, 2][i],
                 size=5,
             ),
-        )
-        .append_to_list(records)
-        .set_metadata({"run_num": run_num})
-        for i, col in enumerate(value_columns)
-    ]
+        ).append_to_list(records).set_metadata({"run_num": run_num})
     trendify.AxLine(
         tags=["trace_plot_log_xy"],
         value=2.5,
@@ -280,10 +291,10 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
         scale_x=trendify.AxisScale.LOG,
         scale_y=trendify.AxisScale.LINEAR,
     ).append_to_list(records)
-    traces = [
+    for i, col in enumerate(value_columns):
         trendify.Trace2D(
             x=transform(time, trendify.AxisScale.LOG),
-            y=df[col].to_numpy(),
+            y=values[col],
             tags=["trace_plot_log_x"],
             pen=trendify.Pen(
                 label=col,
@@ -291,23 +302,21 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
                 linestyle=linestyles[i % len(linestyles)],
                 alpha=alphas[i],
             ),
-        )
-        .append_to_list(records)
-        .set_metadata({"run_num": run_num})
-        for i, col in enumerate(value_columns)
-    ]
+        ).append_to_list(records).set_metadata({"run_num": run_num})
 
     trendify.Format2D(tags=["scatter_plot"], title_fig="N Points").append_to_list(
         records
     )
-    for i, trace in enumerate(traces):
+    # Every trace shares the same `time` axis, so its point count is the same for all of them.
+    n_points = len(time)
+    for i, col in enumerate(value_columns):
         trendify.Point2D(
             x=workdir.name,
-            y=len(trace.x),
+            y=n_points,
             marker=trendify.Marker(
                 size=10,
-                label=trace.pen.label,
-                color=trace.pen.color,
+                label=col,
+                color=colors[i],
                 alpha=alphas[i],
             ),
             tags=["scatter_plot"],
@@ -319,7 +328,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
     ).append_to_list(records)
     trendify.Trace2D(
         x=time,
-        y=df[value_columns[0]].to_numpy(),
+        y=values[value_columns[0]],
         tags=[("nested_plots", "group_a", "deep_trace")],
         pen=trendify.Pen(label=value_columns[0], color=colors[0]),
     ).append_to_list(records).set_metadata({"run_num": run_num})
@@ -329,7 +338,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
     ).append_to_list(records)
     trendify.Trace2D(
         x=time,
-        y=df[value_columns[-1]].to_numpy(),
+        y=values[value_columns[-1]],
         tags=[("nested_plots", "group_b", "deep_trace")],
         pen=trendify.Pen(label=value_columns[-1], color=colors[-1]),
     ).append_to_list(records).set_metadata({"run_num": run_num})
@@ -349,6 +358,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
 
     for col in value_columns:
         series = df[col]
+        mean = cast(float, series.mean())
         trendify.TableEntry(
             row=workdir.name,
             col=col,
@@ -359,7 +369,7 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
         trendify.TableEntry(
             row=workdir.name,
             col=col,
-            value=cast(float, series.mean()),
+            value=mean,
             tags=[("tables", "means")],
             unit=None,
         ).append_to_list(records)
@@ -385,7 +395,6 @@ def example_record_generator(workdir: Path) -> trendify.RecordList:
             unit=None,
         ).append_to_list(records)
 
-        mean = cast(float, series.mean())
         trendify.HistogramEntry(
             tags=["histogram"],
             value=mean,
@@ -36,6 +36,12 @@ logger = logging.getLogger(__name__)
 # never open a `RecordStore`; only the caller of `generate_records` writes.
 _worker_generator: RecordGenerator | None = None
 
+# Upper bound on run directories per pool task. A worker holds every `RecordList` in its chunk
+# until the whole chunk is pickled back, and the parent only writes (and reports progress) once
+# a chunk arrives, so a chunk much bigger than this costs peak memory and progress granularity
+# without saving anything measurable on dispatch overhead.
+_MAX_CHUNKSIZE = 8
+
 
 def get_sorted_dirs(dirs: list[Path]) -> list[Path]:
     """
@@ -79,6 +85,16 @@ def _compute(run_dir: Path) -> tuple[Path, RecordList]:
     return run_dir, _worker_generator(run_dir)
 
 
+def _chunk_size(total_dirs: int, n_procs: int) -> int:
+    # ~4 chunks per worker keeps the load balanced if some runs are slower than others; never
+    # below 1 (fewer directories than `n_procs * 4`), never above `_MAX_CHUNKSIZE`.
+    return max(1, min(_MAX_CHUNKSIZE, total_dirs // (n_procs * 4)))
+
+
+def _compute_chunk(run_dirs: list[Path]) -> list[tuple[Path, RecordList]]:
+    return [_compute(run_dir) for run_dir in run_dirs]
+
+
 def generate_records(
     record_generator: RecordGenerator,
     data_dirs: list[Path],
@@ -141,14 +157,23 @@ def generate_records(
                     initializer=_init_worker_with_logging,
                     initargs=(record_generator, log_queue, root_logger.level),
                 ) as executor:
+                    # Batch several run directories into each task so a large number of
+                    # small runs isn't dominated by one pickle/IPC round trip per directory
+                    # (see `_chunk_size`). Chunks are consumed with `as_completed` rather than
+                    # `executor.map`, so one slow early chunk doesn't hold back writing (and
+                    # progress reporting for) chunks that already finished.
+                    chunksize = _chunk_size(total_dirs, n_procs)
                     futures = [
-                        executor.submit(_compute, run_dir) for run_dir in sorted_dirs
+                        executor.submit(_compute_chunk, sorted_dirs[i : i + chunksize])
+                        for i in range(0, total_dirs, chunksize)
                     ]
-                    for completed, future in enumerate(as_completed(futures), start=1):
-                        run_dir, records = future.result()
-                        total += store.write_run(run_dir, records)
-                        logger.info(f"Wrote records for run_dir = '{run_dir}'")
-                        _report(run_dir, completed)
+                    completed = 0
+                    for future in as_completed(futures):
+                        for run_dir, records in future.result():
+                            total += store.write_run(run_dir, records)
+                            logger.info(f"Wrote records for run_dir = '{run_dir}'")
+                            completed += 1
+                            _report(run_dir, completed)
             finally:
                 # Blocks until every already-queued log record has been dispatched, so worker
                 # log output isn't lost or interleaved with what follows.
@@ -11,7 +11,7 @@ from pydantic import BaseModel
 
 from trendify.base.helpers import Tag
 from trendify.plotting.figure import SingleAxisFigure
-from trendify.plotting.histogram import HistogramEntry
+from trendify.plotting.histogram import HistogramEntry, HistogramStyle
 
 __all__ = ["Histogrammer"]
 
@@ -46,14 +46,17 @@ class Histogrammer(BaseModel):
         if saf is None:
             saf = SingleAxisFigure.new(tag=tag)
 
-        histogram_styles = set(h.style for h in histogram_entries)
+        # One pass bucketing values by style (`HistogramStyle` is hashable), rather than
+        # re-scanning every entry once per distinct style. Dict order also makes the draw
+        # order follow each style's first appearance instead of arbitrary `set` order.
+        values_by_style: dict[HistogramStyle | None, list[float | str]] = {}
+        for entry in histogram_entries:
+            values_by_style.setdefault(entry.style, []).append(entry.value)
         logger.debug(
-            f"Histogramming {len(histogram_entries)} entries into {len(histogram_styles)} "
+            f"Histogramming {len(histogram_entries)} entries into {len(values_by_style)} "
             f"style(s) for {tag = }"
         )
-        for style in histogram_styles:
-            matching_entries = [e for e in histogram_entries if e.style == style]
-            values = [e.value for e in matching_entries]
+        for style, values in values_by_style.items():
             if style is not None:
                 saf.ax.hist(values, **style.as_plot_kwargs())
             else:
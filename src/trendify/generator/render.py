@@ -18,12 +18,11 @@ from __future__ import annotations
 import logging
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
-
-import matplotlib.pyplot as plt
+from typing import Any, cast
 
 from trendify.base.helpers import Tag
-from trendify.formats.format2d import Format2D, Rastered
+from trendify.formats.format2d import Format2D, PlottableData2D, Rastered
+from trendify.formats.table import TableEntry
 from trendify.generator.histogrammer import Histogrammer
 from trendify.generator.table_builder import TableBuilder
 from trendify.generator.xy_data_plotter import XYDataPlotter
@@ -42,36 +41,47 @@ __all__ = ["render_assets"]
 
 logger = logging.getLogger(__name__)
 
-# Per-process global set by `_init_worker`: the one read-only connection a render worker needs.
+# Per-process globals set by `_init_worker`: the one read-only connection a render worker
+# needs, and the output directory every tag it renders is written under. Both are the same
+# for every task, so they're sent once per worker rather than pickled into each submit.
+# `_worker_created_dirs` remembers which output directories this worker already made, so
+# sibling tags sharing a directory don't each repeat the `mkdir`. It starts empty with every
+# pool, i.e. once per `render_assets` call, so it never outlives the run that filled it.
 _worker_store: RecordStore | None = None
+_worker_output_dir: Path | None = None
+_worker_created_dirs: set[Path] = set()
 
 
-def _init_worker(db_path: str) -> None:
-    global _worker_store
+def _init_worker(db_path: str, output_dir: str) -> None:
+    global _worker_store, _worker_output_dir, _worker_created_dirs
     _worker_store = RecordStore.open(Path(db_path), readonly=True)
+    _worker_output_dir = Path(output_dir)
+    _worker_created_dirs = set()
 
 
 def _init_worker_with_logging(
     db_path: str,
+    output_dir: str,
     log_queue: Any,
     log_level: int,
 ) -> None:
     _init_worker_logging(log_queue, log_level)
-    _init_worker(db_path)
+    _init_worker(db_path, output_dir)
 
 
-def _render_tag(
-    tag: Tag,
-    output_dir: str,
-) -> Tag:
+def _render_tag(tag: Tag, has_tables: bool, has_plots: bool) -> Tag:
     # Returns `tag` (not just None) so the parent process's as_completed loop knows which tag
     # a given future was for, to report progress -- `future.result()` is the only thing that
     # survives the process boundary back to the parent.
     assert _worker_store is not None
+    assert _worker_output_dir is not None
     _render_tag_assets(
         _worker_store,
         tag,
-        Path(output_dir),
+        _worker_output_dir,
+        _worker_created_dirs,
+        has_tables=has_tables,
+        has_plots=has_plots,
     )
     return tag
 
@@ -80,21 +90,36 @@ def _render_tag_assets(
     store: RecordStore,
     tag: Tag,
     output_dir: Path,
+    created_dirs: set[Path],
+    has_tables: bool = True,
+    has_plots: bool = True,
 ) -> None:
-    melted = store.get_table_entries(tag)
-    if melted.height > 0:
-        logger.info(f"Making tables for {tag = }")
-        TableBuilder.process_table_entries(tag=tag, melted=melted, out_dir=output_dir)
-        logger.info(f"Finished tables for {tag = }")
+    # `has_tables`/`has_plots` come from `RecordStore.get_tag_record_types`, so a tag known
+    # to hold only tables (or only plot data) skips the other query entirely.
+    if has_tables:
+        melted = store.get_table_entries(tag)
+        if melted.height > 0:
+            logger.info(f"Making tables for {tag = }")
+            TableBuilder.process_table_entries(
+                tag=tag, melted=melted, out_dir=output_dir, created_dirs=created_dirs
+            )
+            logger.info(f"Finished tables for {tag = }")
 
-    format2d_records = store.get_records_of_type(Format2D, tag=tag)
+    if not has_plots:
+        return
+
+    # One query for every record type a plot can be built from, instead of one per type.
+    by_type = store.get_records_by_type(
+        (Format2D, Point2D, Trace2D, Scatter2D, AxLine, HistogramEntry), tag=tag
+    )
+    format2d_records = cast("list[Format2D]", by_type[Format2D])
     format2d = format2d_records[0] if format2d_records else None
 
-    points = store.get_records_of_type(Point2D, tag=tag)
-    traces = store.get_records_of_type(Trace2D, tag=tag)
-    scatters = store.get_records_of_type(Scatter2D, tag=tag)
-    axlines = store.get_records_of_type(AxLine, tag=tag)
-    histogram_entries = store.get_records_of_type(HistogramEntry, tag=tag)
+    points = cast("list[Point2D]", by_type[Point2D])
+    traces = cast("list[Trace2D]", by_type[Trace2D])
+    scatters = cast("list[Scatter2D]", by_type[Scatter2D])
+    axlines = cast("list[AxLine]", by_type[AxLine])
+    histogram_entries = cast("list[HistogramEntry]", by_type[HistogramEntry])
 
     if not (points or traces or scatters or axlines or histogram_entries):
         return
@@ -121,10 +146,11 @@ def _render_tag_assets(
     save_path = output_dir.joinpath(*tag_to_path_parts(tag)).with_suffix(
         renderer.filetype
     )
-    save_path.parent.mkdir(parents=True, exist_ok=True)
+    if save_path.parent not in created_dirs:
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        created_dirs.add(save_path.parent)
     logger.info(f"Saving to '{save_path}'")
     saf.savefig(save_path, dpi=renderer.dpi if isinstance(renderer, Rastered) else None)
-    plt.close(saf.fig)
     logger.info(f"Finished plot for {tag = }")
 
 
@@ -152,8 +178,13 @@ def render_assets(
 
     with RecordStore.open(db_path, readonly=True) as store:
         tags = store.tag_tree()
+        types_by_tag = store.get_tag_record_types((TableEntry, PlottableData2D))
     total_tags = len(tags)
 
+    def _kinds(tag: Tag) -> tuple[bool, bool]:
+        types = types_by_tag.get(tag, set())
+        return TableEntry in types, PlottableData2D in types
+
     def _report(tag: Tag, completed: int) -> None:
         if on_progress is not None:
             on_progress(
@@ -173,15 +204,15 @@ def render_assets(
             with ProcessPoolExecutor(
                 max_workers=n_procs,
                 initializer=_init_worker_with_logging,
-                initargs=(str(db_path), log_queue, root_logger.level),
+                initargs=(
+                    str(db_path),
+                    str(output_dir),
+                    log_queue,
+                    root_logger.level,
+                ),
             ) as executor:
                 futures = [
-                    executor.submit(
-                        _render_tag,
-                        tag,
-                        str(output_dir),
-                    )
-                    for tag in tags
+                    executor.submit(_render_tag, tag, *_kinds(tag)) for tag in tags
                 ]
                 for completed, future in enumerate(as_completed(futures), start=1):
                     finished_tag = future.result()
@@ -189,7 +220,16 @@ def render_assets(
         finally:
             listener.stop()
     else:
+        created_dirs: set[Path] = set()
         with RecordStore.open(db_path, readonly=True) as store:
             for completed, tag in enumerate(tags, start=1):
-                _render_tag_assets(store, tag, output_dir)
+                has_tables, has_plots = _kinds(tag)
+                _render_tag_assets(
+                    store,
+                    tag,
+                    output_dir,
+                    created_dirs,
+                    has_tables=has_tables,
+                    has_plots=has_plots,
+                )
                 _report(tag, completed)
@@ -41,7 +41,11 @@ class TableBuilder(BaseModel):
 
     @classmethod
     def process_table_entries(
-        cls, tag: Tag, melted: pl.DataFrame, out_dir: Path
+        cls,
+        tag: Tag,
+        melted: pl.DataFrame,
+        out_dir: Path,
+        created_dirs: set[Path] | None = None,
     ) -> None:
         """
         Saves CSV files for the melted data frame, pivot dataframe, and pivot dataframe stats.
@@ -54,6 +58,9 @@ class TableBuilder(BaseModel):
             melted (pl.DataFrame): row/col/value/unit table, as returned by
                 `RecordStore.get_table_entries`
             out_dir (Path): directory under which the CSVs are saved (nested per tag)
+            created_dirs (set[Path] | None): directories already created during this run.
+                The tag's directory is only created if it isn't in here, and is added once
+                made. `None` always creates it.
 
         """
         if melted.height == 0:
@@ -69,7 +76,10 @@ class TableBuilder(BaseModel):
 
         *parents, stem = tag_to_path_parts(tag)
         save_dir = out_dir.joinpath(*parents)
-        save_dir.mkdir(parents=True, exist_ok=True)
+        if created_dirs is None or save_dir not in created_dirs:
+            save_dir.mkdir(parents=True, exist_ok=True)
+            if created_dirs is not None:
+                created_dirs.add(save_dir)
         logger.info(f"Saving tables for {tag = } to '{save_dir}/{stem}_*.csv'")
 
         _write_csv(melted, save_dir / f"{stem}_melted.csv")
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
 from pydantic import BaseModel
 
 from trendify.base.helpers import Tag
@@ -15,6 +16,7 @@ from trendify.plotting.figure import SingleAxisFigure
 from trendify.plotting.point import Point2D
 from trendify.plotting.scatter import Scatter2D
 from trendify.plotting.trace import Trace2D
+from trendify.styling.marker import Marker
 
 __all__ = ["XYDataPlotter"]
 
@@ -46,8 +48,8 @@ class XYDataPlotter(BaseModel):
                 marker becomes one `ax.scatter` call/series)
             traces (list[Trace2D]): traces to plot
             axlines (list[AxLine]): axis lines to plot
-            scatters (list[Scatter2D]): bulk scatter arrays to plot, each already carrying
-                its own single shared `Marker`
+            scatters (list[Scatter2D]): bulk scatter arrays to plot, concatenated per
+                distinct `Marker` (each becomes one `ax.scatter` call/series)
             saf (SingleAxisFigure | None): figure to draw onto; a new one is created if `None`
 
         Returns:
@@ -61,20 +63,35 @@ class XYDataPlotter(BaseModel):
             f"Plotting {len(points)} point(s), {len(traces)} trace(s), {len(axlines)} "
             f"axline(s), {len(scatters)} scatter(s) for {tag = }"
         )
-        if points:
-            markers = set(p.marker for p in points)
-            for marker in markers:
-                matching_points = [p for p in points if p.marker == marker]
-                x = [p.x for p in matching_points]
-                y = [p.y for p in matching_points]
-                if x and y:
-                    if marker is not None:
-                        saf.ax.scatter(x, y, **marker.as_scatter_plot_kwargs())
-                    else:
-                        saf.ax.scatter(x, y)
-
+        # One pass bucketing x/y by marker (`Marker` is hashable), rather than re-scanning
+        # every point once per distinct marker. x/y stay plain lists, not arrays: `Point2D`
+        # values may be strings, which matplotlib plots as categories.
+        xy_by_marker: dict[Marker | None, tuple[list, list]] = {}
+        for point in points:
+            x, y = xy_by_marker.setdefault(point.marker, ([], []))
+            x.append(point.x)
+            y.append(point.y)
+        for marker, (x, y) in xy_by_marker.items():
+            if marker is not None:
+                saf.ax.scatter(x, y, **marker.as_scatter_plot_kwargs())
+            else:
+                saf.ax.scatter(x, y)
+
+        # Same for bulk scatters: every `Scatter2D` sharing a marker (typically one per run,
+        # all under one tag) is drawn as one concatenated `PathCollection` instead of one
+        # collection per record. Their x/y are numeric arrays, so they concatenate directly.
+        scatters_by_marker: dict[Marker, list[Scatter2D]] = {}
         for scatter in scatters:
-            scatter.plot_to_ax(saf.ax)
+            scatters_by_marker.setdefault(scatter.marker, []).append(scatter)
+        for marker, group in scatters_by_marker.items():
+            if len(group) == 1:
+                group[0].plot_to_ax(saf.ax)
+                continue
+            saf.ax.scatter(
+                np.concatenate([np.asarray(s.x) for s in group]),
+                np.concatenate([np.asarray(s.y) for s in group]),
+                **marker.as_scatter_plot_kwargs(),
+            )
 
         for trace in traces:
             trace.plot_to_ax(saf.ax)
@@ -14,9 +14,10 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 import plotly.graph_objects as go
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from pydantic import ConfigDict
 
 from trendify.base.helpers import Tag
@@ -24,7 +25,6 @@ from trendify.formats.format2d import AxisScale, PlottableData2D
 
 if TYPE_CHECKING:
     from matplotlib.axes import Axes
-    from matplotlib.figure import Figure
 
     from trendify.formats.format2d import Format2D
     from trendify.styling.grid import Grid
@@ -35,10 +35,11 @@ __all__ = ["PlotlyFigure", "SingleAxisFigure"]
 logger = logging.getLogger(__name__)
 
 # This pipeline only ever renders headlessly (batch CLI/worker processes, no interactive
-# window), so pin the backend explicitly before the first figure is ever created. Left
-# unset, pyplot's lazy backend auto-selection probes for a live GUI display on the very
-# first `plt.figure()` call (`matplotlib._c_internal_utils.display_is_valid`), which is a
-# multi-second stall on some systems for a check whose answer we don't care about anyway.
+# window). `SingleAxisFigure` doesn't go through pyplot at all, but user code running in the
+# same process still might, so pin the backend anyway. Left unset, pyplot's lazy backend
+# auto-selection probes for a live GUI display on the very first `plt.figure()` call
+# (`matplotlib._c_internal_utils.display_is_valid`), which is a multi-second stall on some
+# systems for a check whose answer we don't care about anyway.
 matplotlib.use("Agg")
 
 
@@ -71,7 +72,12 @@ class SingleAxisFigure:
             (Type[Self]): New single axis figure
 
         """
-        fig = plt.figure()
+        # Built as a bare `Figure` on its own Agg canvas rather than via `plt.figure()`:
+        # pyplot would register it in its global figure manager (which then has to be
+        # `plt.close`d, or it leaks), and nothing here ever needs pyplot's current-figure
+        # state. A figure no one holds a reference to is simply garbage collected.
+        fig = Figure()
+        FigureCanvasAgg(fig)
         ax = fig.add_subplot(1, 1, 1)
         return cls(
             tag=tag,
@@ -93,7 +99,9 @@ class SingleAxisFigure:
             self.fig.suptitle(format2d.title_fig)
 
         leg = None
-        if format2d.legend is not None:
+        # `get_legend_handles_labels` walks every artist on the axes, so skip it outright for
+        # an axes nothing was drawn to, which can't have anything to put in a legend anyway.
+        if format2d.legend is not None and self.ax.has_data():
             with warnings.catch_warnings(action="ignore", category=UserWarning):
                 handles, labels = self.ax.get_legend_handles_labels()
                 by_label = dict(zip(labels, handles))
@@ -129,7 +137,10 @@ class SingleAxisFigure:
             self.apply_grid(format2d.grid)
 
         self.fig.set_size_inches(format2d.figure_width, format2d.figure_height)
-        self.fig.tight_layout(rect=(0, 0.03, 1, 0.95))
+        # Constrained layout rather than a one-off `tight_layout()`: it's solved once, at
+        # save time, against the final size, and it already reserves room for a `suptitle`
+        # and an outside-the-axes legend (which the old hand-tuned `rect` approximated).
+        self.fig.set_layout_engine("constrained")
         return self
 
     def apply_grid(self, grid: Grid):
@@ -179,18 +190,17 @@ class SingleAxisFigure:
 
         """
         logger.debug(f"Saving matplotlib figure for {self.tag = } to {path} ({dpi = })")
+        kwargs: dict[str, Any] = {}
         if dpi is not None:
-            self.fig.savefig(path, dpi=dpi)
-        else:
-            self.fig.savefig(path)
+            kwargs["dpi"] = dpi
+        if Path(path).suffix.lower() == ".png":
+            # PNG is lossless at any zlib level, so the level only trades file size for
+            # encode time. Pillow's default (6) makes encoding dominate the save of a large,
+            # high-dpi figure; level 1 is several times faster for a modestly bigger file.
+            kwargs["pil_kwargs"] = {"compress_level": 1}
+        self.fig.savefig(path, **kwargs)
         return self
 
-    def __del__(self):
-        """
-        Closes stored matplotlib figure before deleting reference to object.
-        """
-        plt.close(self.fig)
-
 
 @dataclass
 class PlotlyFigure:
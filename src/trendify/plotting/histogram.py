@@ -7,7 +7,7 @@ used by both renderers).
 from __future__ import annotations
 
 import logging
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 import numpy as np
 import plotly.graph_objects as go
@@ -24,6 +24,15 @@ __all__ = ["HistogramEntry", "HistogramStyle"]
 logger = logging.getLogger(__name__)
 
 
+def _is_zero(value: Any) -> bool:
+    # Raw, not-yet-validated input: `0`, `0.0` and `"0"` all count. Anything that isn't
+    # numeric is left for field validation to reject.
+    try:
+        return float(value) == 0
+    except (TypeError, ValueError):
+        return False
+
+
 class HistogramStyle(HashableBase):
     """
     Label and style data for generating histogram bars
@@ -65,19 +74,28 @@ class HistogramStyle(HashableBase):
             return tuple(int(v) for v in value)
         return value
 
-    @model_validator(mode="after")
-    def _visible_edge_for_step_histtype(self) -> HistogramStyle:
+    @model_validator(mode="before")
+    @classmethod
+    def _visible_edge_for_step_histtype(cls, data: Any) -> Any:
         # `histtype="step"` draws an edge-only patch (`fill=False`), so `alpha_edge` is the
         # only thing that can make it visible at all, unlike "bar"/"stepfilled" where the
         # face fill carries the color and a zero-alpha edge is just borderless.
-        # `alpha_edge`'s class default of 0 is right for those other histtypes but leaves a
-        # "step" histogram completely invisible, so bump it to opaque if left at zero.
-        if self.histtype == "step" and self.alpha_edge == 0:
+        # A zero `alpha_edge` is right for those other histtypes but leaves a "step"
+        # histogram completely invisible, so bump it to opaque if set to zero. This runs on
+        # the raw input (`mode="before"`) since the model is frozen once built. Raw input is
+        # a dict for keywords, `model_validate` and JSON loads alike (pydantic doesn't
+        # revalidate an already-built instance), but `alpha_edge` isn't coerced to a float
+        # yet, so `"0"` has to count as zero too.
+        if (
+            isinstance(data, dict)
+            and data.get("histtype") == "step"
+            and _is_zero(data.get("alpha_edge"))
+        ):
             logger.warning(
                 "Histogram type was set to 'step' but alpha_edge was 0, coercing edge transparency to 1"
             )
-            self.alpha_edge = 1
-        return self
+            data = {**data, "alpha_edge": 1.0}
+        return data
 
     def as_plot_kwargs(self):
         """
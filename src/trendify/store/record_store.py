@@ -36,19 +36,6 @@ __all__ = ["RecordStore"]
 logger = logging.getLogger(__name__)
 
 
-def _leaf_type_names(object_type: type[Record]) -> list[str]:
-    """
-    Expands a (possibly non-leaf) `Record` type into the list of registered leaf
-    `record_type` names that are instances of it: `PlottableData2D`, for example, expands to
-    `["Point2D", "Trace2D", "AxLine", "HistogramEntry"]`. This lets tag/type filtering happen
-    as a plain SQL `record_type IN (...)` clause instead of deserializing every tag-matched
-    row just to run an `isinstance` check in Python.
-    """
-    return [
-        name for name, cls in Record.registry().items() if issubclass(cls, object_type)
-    ]
-
-
 def _tag_sort_key(tag: Tag):
     # `Tag` elements may be `str` or `int`, which aren't comparable to each other; sorting
     # each element on `(is_int, value)` keeps same-type elements ordered by value while
@@ -251,7 +238,7 @@ class RecordStore:
         if object_type is None:
             rows = self._conn.execute("SELECT DISTINCT tag_key FROM record_tags")
         else:
-            names = _leaf_type_names(object_type)
+            names = object_type.leaf_type_names()
             if not names:
                 return set()
             placeholders = ",".join("?" * len(names))
@@ -281,6 +268,38 @@ class RecordStore:
         ).fetchall()
         return {decode_tag(r["tag_key"]): r["size"] for r in rows}
 
+    def get_tag_record_types(
+        self, object_types: Iterable[type[Record]]
+    ) -> dict[Tag, set[type[Record]]]:
+        """
+        Which of `object_types` each tag has records of, for every tag at once. Answers from
+        the `record_tags` index alone (one `DISTINCT` scan over `(tag_key, record_type)`,
+        no payloads read), for callers like the viewer's tag tree that would otherwise make
+        one `has_records`/`has_table_entries` round trip per tag per type.
+
+        Args:
+            object_types (Iterable[type[Record]]): types (or base types) to check for
+
+        Returns:
+            (dict[Tag, set[type[Record]]]): the requested types with at least one record
+                under each tag; tags with none of them are left out
+
+        """
+        types_by_name: dict[str, list[type[Record]]] = {}
+        for object_type in object_types:
+            for name in object_type.leaf_type_names():
+                types_by_name.setdefault(name, []).append(object_type)
+
+        index: dict[Tag, set[type[Record]]] = {}
+        rows = self._conn.execute(
+            "SELECT DISTINCT tag_key, record_type FROM record_tags"
+        )
+        for r in rows:
+            matched = types_by_name.get(r["record_type"])
+            if matched:
+                index.setdefault(decode_tag(r["tag_key"]), set()).update(matched)
+        return index
+
     def tag_tree(self, object_type: type[Record] | None = None) -> list[Tag]:
         """
         Returns:
@@ -311,6 +330,58 @@ class RecordStore:
 
         """
         logger.debug(f"Querying records ({tag = }, {object_type = })")
+        names = object_type.leaf_type_names() if object_type is not None else None
+        for _, record in self._query_records(tag=tag, record_types=names):
+            yield cast(R, record)
+
+    def get_records_by_type(
+        self,
+        object_types: Iterable[type[Record]],
+        tag: Tag | None = None,
+    ) -> dict[type[Record], list[Record]]:
+        """
+        Fetches records of several types in a single query and buckets them by type, for
+        callers (like rendering a tag) that would otherwise call `get_records_of_type` once
+        per type and pay for one SQL round trip and tag lookup each time.
+
+        A record lands in the bucket of every requested type it's an instance of, so
+        overlapping types (e.g. `PlottableData2D` and `Point2D`) each see the same records
+        they'd get from separate `get_records_of_type` calls.
+
+        Args:
+            object_types (Iterable[type[Record]]): types (or base types) to fetch
+            tag (Tag | None): tag to filter by; `None` matches every tag
+
+        Returns:
+            (dict[type[Record], list[Record]]): one list per requested type (empty if
+                nothing matched), each in insertion order
+
+        """
+        grouped: dict[type[Record], list[Record]] = {t: [] for t in object_types}
+        buckets_by_name: dict[str, list[list[Record]]] = {}
+        for object_type, bucket in grouped.items():
+            for name in object_type.leaf_type_names():
+                buckets_by_name.setdefault(name, []).append(bucket)
+
+        logger.debug(f"Querying records ({tag = }, object_types = {list(grouped)})")
+        for record_type, record in self._query_records(
+            tag=tag, record_types=tuple(buckets_by_name)
+        ):
+            for bucket in buckets_by_name[record_type]:
+                bucket.append(record)
+        return grouped
+
+    def _query_records(
+        self,
+        tag: Tag | None,
+        record_types: tuple[str, ...] | None,
+    ) -> Iterator[tuple[str, Record]]:
+        # Shared by `get_records`/`get_records_by_type`: filters by `tag` and leaf
+        # `record_type` names in SQL, then deserializes only the matching rows. `None` means
+        # no type filter; an empty tuple means nothing can match.
+        if record_types is not None and not record_types:
+            return
+
         select = "SELECT p.record_type, p.payload FROM records p"
         joins = []
         where = []
@@ -321,12 +392,9 @@ class RecordStore:
             where.append("pt.tag_key = ?")
             params.append(encode_tag(tag))
 
-        if object_type is not None:
-            names = _leaf_type_names(object_type)
-            if not names:
-                return
-            where.append(f"p.record_type IN ({','.join('?' * len(names))})")
-            params.extend(names)
+        if record_types is not None:
+            where.append(f"p.record_type IN ({','.join('?' * len(record_types))})")
+            params.extend(record_types)
 
         query = " ".join([select, *joins])
         if where:
@@ -334,7 +402,8 @@ class RecordStore:
 
         cursor = self._conn.execute(query, params)
         for row in cursor:
-            yield cast(R, Record.deserialize(row["record_type"], row["payload"]))
+            record_type = row["record_type"]
+            yield record_type, Record.deserialize(record_type, row["payload"])
 
     def get_records_of_type(
         self, object_type: type[R], tag: Tag | None = None
@@ -349,9 +418,9 @@ class RecordStore:
     ) -> bool:
         """
         Cheap existence check for `get_records`'s same `(tag, object_type)` filter: stops at
-        the first matching row instead of deserializing every one, for callers (like the
-        viewer's tag tree, `viewer.tag_tree._record_kinds`) that only need to know whether
-        *any* record matches, not what it is.
+        the first matching row instead of deserializing every one, for callers that only
+        need to know whether *any* record matches, not what it is. To check many tags at
+        once, `get_tag_record_types` answers for all of them in one query.
         """
         return (
             next(self.get_records(tag=tag, object_type=object_type), None) is not None
@@ -384,7 +453,12 @@ class RecordStore:
         ).fetchall()
         logger.debug(f"Fetched {len(rows)} table_entries row(s) for {tag = }")
 
-        records = []
+        # Built column-wise (one list per output column) rather than as one dict per row,
+        # which skips a dict allocation per entry and lets Polars take each column whole.
+        row_keys: list[str] = []
+        col_keys: list[str] = []
+        values: list[object] = []
+        units: list[str | None] = []
         for r in rows:
             if r["value_bool"] is not None:
                 value = bool(r["value_bool"])
@@ -392,17 +466,13 @@ class RecordStore:
                 value = r["value_num"]
             else:
                 value = r["value_text"]
-            records.append(
-                {
-                    "row": r["row_key"],
-                    "col": r["col_key"],
-                    "value": value,
-                    "unit": r["unit"],
-                }
-            )
+            row_keys.append(r["row_key"])
+            col_keys.append(r["col_key"])
+            values.append(value)
+            units.append(r["unit"])
 
         return pl.DataFrame(
-            records,
+            {"row": row_keys, "col": col_keys, "value": values, "unit": units},
             schema={
                 "row": pl.Utf8,
                 "col": pl.Utf8,
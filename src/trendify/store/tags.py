@@ -14,6 +14,11 @@ from trendify.base.helpers import Tag
 
 __all__ = ["decode_tag", "encode_tag", "tag_to_path_parts"]
 
+# `json.dumps` with any non-default keyword argument (like `separators`) builds a brand new
+# `JSONEncoder` on every call; `encode_tag` runs once per tag per record written and once
+# per query, so build the compact encoder once and reuse it.
+_TAG_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
 def encode_tag(tag: Tag) -> str:
     """
@@ -28,7 +33,7 @@ def encode_tag(tag: Tag) -> str:
         (str): canonical, indexable string key
 
     """
-    return json.dumps(tag, separators=(",", ":"))
+    return _TAG_ENCODER.encode(tag)
 
 
 def decode_tag(tag_key: str) -> Tag:
@@ -1,5 +1,5 @@
 from trendify.viewer import app as viewer_app
-from trendify.viewer import plot_config, routes, tag_tree
+from trendify.viewer import plot_config, response_cache, routes, tag_tree
 from trendify.viewer.app import (
     create_app,
     create_app_from_env,
@@ -34,6 +34,7 @@ __all__ = [
     "create_app_from_env",
     "pages",
     "plot_config",
+    "response_cache",
     "router",
     "routes",
     "tag_tree",
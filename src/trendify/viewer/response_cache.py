@@ -0,0 +1,75 @@
+"""
+Process-lifetime response cache shared by the viewer's route modules. Entries live in the
+plain dict on `request.app.state.response_cache` (created by `viewer.app.create_app`), keyed by
+a tuple naming what was built, and are dropped whenever the `.db` file's mtime changes (see
+`invalidate_if_db_changed`).
+
+Keys that more than one route reads (e.g. the tag tree, which both the server-rendered index page
+and the `/tags` endpoint use) are defined here once, so the routes can't drift apart on them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import cast
+
+from fastapi import Request
+
+__all__ = ["TAG_TREE_KEY", "cached", "invalidate_if_db_changed"]
+
+TAG_TREE_KEY: tuple = ("tags",)
+"""Cache key for the full tag tree, shared by `routes.pages.index` and `routes.api.get_tags`."""
+
+
+def invalidate_if_db_changed(request: Request) -> float | None:
+    """
+    Clears the response cache if the `.db` file's mtime differs from the last one seen. The
+    `.db` file can be regenerated out from under a running `viewer` process (e.g. someone
+    re-runs `trendify generate`/`run`); the `RecordStore` connection stays valid across that
+    (the generate pipeline writes into the same file via WAL, it doesn't replace it), only the
+    cached responses go stale. One `stat` per call, so it's cheap enough to run on every lookup.
+
+    Args:
+        request (Request): current request, whose app holds the cache and last-seen mtime
+
+    Returns:
+        (float | None): the `.db` file's current mtime, or `None` if it can't be read
+
+    """
+    db_path: Path = request.app.state.db_path
+    try:
+        mtime = db_path.stat().st_mtime
+    except OSError:
+        mtime = None
+
+    if mtime is not None and mtime != request.app.state.db_mtime:
+        request.app.state.db_mtime = mtime
+        request.app.state.response_cache.clear()
+    return mtime
+
+
+async def cached[T](
+    request: Request, cache_key: tuple, build: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Process-lifetime response cache: the viewer never writes to its `.db` file, so a handler's
+    expensive work only needs to run once per distinct cache key for as long as the file is
+    unchanged -- whichever request (hydration or a real click) happens to compute it first, the
+    other reuses the result. Checks the file's mtime first (`invalidate_if_db_changed`), so a
+    regenerated `.db` is picked up by every caller, not only once `/ping` notices it.
+
+    Args:
+        request (Request): current request, whose app holds the cache dict
+        cache_key (tuple): identifies the response being built
+        build (Callable[[], Awaitable[T]]): computes the response on a cache miss
+
+    Returns:
+        (T): the cached (or freshly built and now cached) response
+
+    """
+    invalidate_if_db_changed(request)
+    cache: dict[tuple, object] = request.app.state.response_cache
+    if cache_key not in cache:
+        cache[cache_key] = await build()
+    return cast(T, cache[cache_key])
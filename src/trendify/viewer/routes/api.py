@@ -6,8 +6,9 @@ client-side refresh/polling use), a liveness/db-change ping, and the table/plot
 Every handler reads from the process-lifetime, read-only `RecordStore` on
 `request.app.state.store` and caches its response in `request.app.state.response_cache`. The
 `.db` file can be regenerated out from under a running `viewer` process (e.g. someone re-runs
-`trendify generate`/`run`); `/ping` detects that via the file's mtime and clears the cache, so
-this is a cache invalidation concern rather than something that makes the cache unsafe to use.
+`trendify generate`/`run`); every cache lookup (and `/ping`) checks the file's mtime and clears
+the cache when it changes, so this is a cache invalidation concern rather than something that
+makes the cache unsafe to use.
 
 `/table` and `/plot` requests tagged `X-Trendify-Hydrate` (the frontend's background-prefetch
 scheduler, not a real click -- see `_is_hydration_request`) instead run against
@@ -20,15 +21,13 @@ from __future__ import annotations
 
 import base64
 import logging
-from collections.abc import Awaitable, Callable
-from pathlib import Path
 from typing import Any, Literal, cast
 
 import numpy as np
 from fastapi import APIRouter, Query, Request
 from pydantic import BaseModel
 
-from trendify.formats.format2d import Format2D
+from trendify.formats.format2d import Format2D, PlottableData2D
 from trendify.generator.table_builder import TableBuilder
 from trendify.plotting.axline import AxLine
 from trendify.plotting.figure import PlotlyFigure
@@ -39,6 +38,11 @@ from trendify.plotting.trace import Trace2D
 from trendify.store.record_store import RecordStore
 from trendify.store.tags import decode_tag
 from trendify.viewer.plot_config import HoverMode, InterpMode, LineMode
+from trendify.viewer.response_cache import (
+    TAG_TREE_KEY,
+    cached,
+    invalidate_if_db_changed,
+)
 from trendify.viewer.tag_tree import TagNode, build_tag_tree
 
 TableView = Literal["melted", "pivot", "stats"]
@@ -91,21 +95,6 @@ def _is_hydration_request(request: Request) -> bool:
     return bool(request.headers.get("x-trendify-hydrate"))
 
 
-async def _cached[T](
-    request: Request, cache_key: tuple, build: Callable[[], Awaitable[T]]
-) -> T:
-    """
-    Process-lifetime response cache: `.db` files are static for the life of a `viewer` process
-    (no write path exists in this feature), so a handler's expensive work only ever needs to
-    run once per distinct cache key -- whichever request (hydration or a real click) happens to
-    compute it first, the other reuses the result.
-    """
-    cache: dict[tuple, object] = request.app.state.response_cache
-    if cache_key not in cache:
-        cache[cache_key] = await build()
-    return cast(T, cache[cache_key])
-
-
 @router.get("/tags", response_model=list[TagNode])
 async def get_tags(request: Request) -> list[TagNode]:
     # async def, not def: see routes.pages.index's comment, this keeps it on the event loop's
@@ -122,7 +111,7 @@ async def get_tags(request: Request) -> list[TagNode]:
             return await request.app.state.hydration_runner.run(build)
         return build(_get_store(request))
 
-    return await _cached(request, ("tags",), resolve)
+    return await cached(request, TAG_TREE_KEY, resolve)
 
 
 @router.get("/ping")
@@ -132,20 +121,10 @@ async def ping(request: Request) -> dict[str, bool | float | None]:
 
     Also reports the `.db` file's mtime, so the client can detect that someone regenerated it
     (e.g. re-ran `trendify generate`/`run` while this server is still up) and prompt a refresh.
-    The underlying `RecordStore` connection itself stays valid across a regeneration (the
-    generate pipeline writes into the same file/inode via WAL, it doesn't replace it); only
-    this process's *response cache* goes stale, so an mtime change clears it here.
+    An mtime change also clears this process's response cache (see
+    `response_cache.invalidate_if_db_changed`).
     """
-    db_path: Path = request.app.state.db_path
-    try:
-        mtime = db_path.stat().st_mtime
-    except OSError:
-        mtime = None
-
-    if mtime is not None and mtime != request.app.state.db_mtime:
-        request.app.state.db_mtime = mtime
-        request.app.state.response_cache.clear()
-
+    mtime = invalidate_if_db_changed(request)
     return {"ok": True, "db_updated_at": mtime}
 
 
@@ -199,7 +178,7 @@ async def get_table(tag: str, view: TableView, request: Request) -> TableRespons
             return await request.app.state.hydration_runner.run(build)
         return build(_get_store(request))
 
-    return await _cached(request, ("table", view, tag), resolve)
+    return await cached(request, ("table", view, tag), resolve)
 
 
 def _plain_list(value: Any) -> list[Any]:
@@ -276,18 +255,19 @@ async def get_plot(
         logger.debug(f"Hydrating tag {decoded_tag!r} in the background (plot)")
 
     def build(store: RecordStore) -> PlotResponse:
-        format2d_records = store.get_records_of_type(Format2D, tag=decoded_tag)
+        # One query for every plottable type (same as `render._render_tag_assets`), bucketed
+        # so records are still added to the figure grouped in this type order.
+        by_type = store.get_records_by_type(
+            (Format2D, Point2D, Trace2D, Scatter2D, AxLine, HistogramEntry),
+            tag=decoded_tag,
+        )
+        format2d_records = cast("list[Format2D]", by_type.pop(Format2D))
         format2d = format2d_records[0] if format2d_records else None
 
-        points = store.get_records_of_type(Point2D, tag=decoded_tag)
-        traces = store.get_records_of_type(Trace2D, tag=decoded_tag)
-        scatters = store.get_records_of_type(Scatter2D, tag=decoded_tag)
-        axlines = store.get_records_of_type(AxLine, tag=decoded_tag)
-        histogram_entries = store.get_records_of_type(HistogramEntry, tag=decoded_tag)
-
         figure = PlotlyFigure.new(decoded_tag)
-        for record in (*points, *traces, *scatters, *axlines, *histogram_entries):
-            figure.add_record(record)
+        for records in by_type.values():
+            for record in records:
+                figure.add_record(cast("PlottableData2D", record))
 
         if not figure.fig.data:
             return PlotResponse(available=False, data=[], layout={})
@@ -332,7 +312,7 @@ async def get_plot(
             return await request.app.state.hydration_runner.run(build)
         return build(_get_store(request))
 
-    return await _cached(
+    return await cached(
         request,
         ("plot", tag, line_mode, interp, hover, show_spike, max_points),
         resolve,
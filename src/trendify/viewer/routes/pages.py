@@ -12,7 +12,8 @@ import logging
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
-from trendify.viewer.tag_tree import build_tag_tree
+from trendify.viewer.response_cache import TAG_TREE_KEY, cached
+from trendify.viewer.tag_tree import TagNode, build_tag_tree
 
 __all__ = ["router"]
 
@@ -27,7 +28,12 @@ async def index(request: Request) -> HTMLResponse:
     # RecordStore's sqlite3 connection is thread-affine to whatever thread opened it (the
     # main thread, in create_app). An `async def` handler that never awaits stays on the
     # event loop's thread instead, matching the connection's affinity.
-    store = request.app.state.store
-    tag_tree = build_tag_tree(store)
+    # Shares `routes.api.get_tags`'s response-cache entry (same key, same value), so a page
+    # reload (or a `/tags` call either side of it) builds the tag tree only once until
+    # `/ping` sees the `.db` change and clears the cache.
+    async def resolve() -> list[TagNode]:
+        return build_tag_tree(request.app.state.store)
+
+    tag_tree = await cached(request, TAG_TREE_KEY, resolve)
     templates = request.app.state.templates
     return templates.TemplateResponse(request, "index.html", {"tag_tree": tag_tree})
@@ -5,13 +5,16 @@ Builds the nested tag hierarchy the sidebar renders, shared by the server-render
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Literal
 
 from pydantic import BaseModel
 
 from trendify.base.helpers import Tag
+from trendify.base.record import Record
 from trendify.formats.format2d import PlottableData2D
+from trendify.formats.table import TableEntry
 from trendify.store.record_store import RecordStore
 from trendify.store.tags import tag_to_path_parts
 
@@ -49,10 +52,7 @@ class TagNode(BaseModel):
         Lowercase text of this node's label and every descendant's label, for substring
         search matching without needing to walk the tree again client-side.
         """
-        parts = [self.label]
-        for child in self.children:
-            parts.append(child.search_blob())
-        return " ".join(parts).lower()
+        return self._search_blob
 
     def subtree_kinds(self) -> list[Literal["plot", "table"]]:
         """
@@ -61,19 +61,40 @@ class TagNode(BaseModel):
         should stay visible under a "table" filter if any record anywhere inside it is a
         table, even if the folder itself has no records of its own).
         """
-        kinds = set(self.record_kinds)
-        for child in self.children:
-            kinds.update(child.subtree_kinds())
-        return sorted(kinds)
+        return list(self._subtree_kinds)
 
     def record_count(self) -> int:
         """
         Recursive count of self-and-descendant nodes with `has_records`, shown as a
         subtle badge next to folder labels in the sidebar.
         """
+        return self._record_count
+
+    # The sidebar template calls each helper above on every node (`search_blob` twice), and
+    # each one aggregates over the node's whole subtree. Memoizing per node means every
+    # subtree is aggregated once, reusing its children's cached results, instead of
+    # re-walking it from every ancestor. A tree is never modified once `build_tag_tree`
+    # returns it, so the cached values can't go stale.
+
+    @functools.cached_property
+    def _search_blob(self) -> str:
+        parts = [self.label]
+        for child in self.children:
+            parts.append(child._search_blob)
+        return " ".join(parts).lower()
+
+    @functools.cached_property
+    def _subtree_kinds(self) -> tuple[Literal["plot", "table"], ...]:
+        kinds = set(self.record_kinds)
+        for child in self.children:
+            kinds.update(child._subtree_kinds)
+        return tuple(sorted(kinds))
+
+    @functools.cached_property
+    def _record_count(self) -> int:
         count = 1 if self.has_records else 0
         for child in self.children:
-            count += child.record_count()
+            count += child._record_count
         return count
 
 
@@ -83,11 +104,11 @@ class _TrieNode:
         self.tag: Tag | None = None
 
 
-def _record_kinds(store: RecordStore, tag: Tag) -> list[Literal["plot", "table"]]:
+def _record_kinds(types: set[type[Record]]) -> list[Literal["plot", "table"]]:
     kinds: list[Literal["plot", "table"]] = []
-    if store.has_records(tag=tag, object_type=PlottableData2D):
+    if PlottableData2D in types:
         kinds.append("plot")
-    if store.has_table_entries(tag):
+    if TableEntry in types:
         kinds.append("table")
     return kinds
 
@@ -124,6 +145,8 @@ def build_tag_tree(store: RecordStore) -> list[TagNode]:
             node.tag = tag
 
     sizes = store.get_tag_byte_sizes()
+    # Every tag's record kinds from one index scan, rather than two existence queries per tag.
+    types_by_tag = store.get_tag_record_types((PlottableData2D, TableEntry))
 
     def to_nodes(level: dict[str, _TrieNode]) -> list[TagNode]:
         nodes = []
@@ -135,7 +158,11 @@ def build_tag_tree(store: RecordStore) -> list[TagNode]:
                     label=label,
                     children=to_nodes(node.children),
                     has_records=tag is not None,
-                    record_kinds=_record_kinds(store, tag) if tag is not None else [],
+                    record_kinds=(
+                        _record_kinds(types_by_tag.get(tag, set()))
+                        if tag is not None
+                        else []
+                    ),
                     size_bytes=sizes.get(tag, 0) if tag is not None else 0,
                 )
             )
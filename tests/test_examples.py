@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from trendify.examples import example_record_generator, make_example_data
 from trendify.formats.format2d import Format2D
 from trendify.formats.table import TableEntry
@@ -30,6 +32,22 @@ class TestMakeExampleData:
         second = (tmp_path / "b" / "models" / "0" / "results.csv").read_text()
         assert first == second
 
+    def test_keeps_the_original_per_seed_draw_order(self, tmp_path: Path):
+        # Pinned to values produced before the wave columns were vectorized: reordering the
+        # RNG draws would silently change the example data for every seed.
+        make_example_data(tmp_path, n_folders=1)
+        model_dir = tmp_path / "models" / "0"
+
+        stdin_lines = (model_dir / "stdin.csv").read_text().splitlines()
+        assert stdin_lines[0] == "n_samples,77"
+        assert stdin_lines[3] == "w2_step_time,0.5203450715366188"
+
+        first_row = (model_dir / "results.csv").read_text().splitlines()[1]
+        values = [float(v) for v in first_row.split(",")]
+        assert values == pytest.approx(
+            [0.0, 0.039120001353904116, 0.10336949591894687, 0.05827143867698117]
+        )
+
 
 class TestExampleRecordGenerator:
     def test_returns_every_plottable_record_type_and_a_table(self, tmp_path: Path):
@@ -3,6 +3,10 @@
 from pathlib import Path
 from typing import Any, cast
 
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.layout_engine import ConstrainedLayoutEngine
+
 from trendify.base.pen import Pen
 from trendify.formats.format2d import AxisScale, Format2D
 from trendify.plotting.figure import PlotlyFigure, SingleAxisFigure
@@ -53,6 +57,13 @@ class TestSingleAxisFigureApplyFormat:
         assert saf.ax.get_yscale() == "linear"
         assert tuple(saf.fig.get_size_inches()) == (5.0, 3.0)
 
+    def test_uses_constrained_layout(self, tmp_path: Path):
+        saf = self._saf_with_two_labeled_lines()
+        saf.apply_format(Format2D(tags=["t"], title_fig="figtitle", legend=Legend()))
+        assert isinstance(saf.fig.get_layout_engine(), ConstrainedLayoutEngine)
+        saf.savefig(tmp_path / "out.png", dpi=50)
+        assert (tmp_path / "out.png").exists()
+
     def test_legend_dedupes_and_sorts_by_label(self):
         saf = self._saf_with_two_labeled_lines()
         saf.apply_format(Format2D(tags=["t"], legend=Legend(edgecolor="red")))
@@ -85,6 +96,14 @@ class TestSingleAxisFigureApplyGrid:
         assert saf.ax.xaxis.get_gridlines()[0].get_visible() is False
 
 
+class TestSingleAxisFigureNew:
+    def test_figure_is_not_registered_with_pyplot(self):
+        n_open = len(plt.get_fignums())
+        saf = SingleAxisFigure.new(tag="t")
+        assert len(plt.get_fignums()) == n_open
+        assert isinstance(saf.fig.canvas, FigureCanvasAgg)
+
+
 class TestSingleAxisFigureSavefig:
     def test_saves_a_file_with_explicit_dpi(self, tmp_path: Path):
         saf = SingleAxisFigure.new(tag="t")
@@ -94,6 +113,24 @@ class TestSingleAxisFigureSavefig:
         assert result is saf
         assert path.exists()
 
+    def test_png_is_saved_with_fast_compression(self, tmp_path: Path):
+        saf = SingleAxisFigure.new(tag="t")
+        saf.ax.plot([0, 1], [0, 1])
+        savefig = saf.fig.savefig
+        seen: list[dict[str, Any]] = []
+
+        def spy(path, **kwargs):
+            seen.append(kwargs)
+            savefig(path, **kwargs)
+
+        saf.fig.savefig = spy  # type: ignore[method-assign]
+        saf.savefig(tmp_path / "out.png", dpi=50)
+        saf.savefig(tmp_path / "out.jpg", dpi=50)
+
+        assert seen[0]["pil_kwargs"] == {"compress_level": 1}
+        assert "pil_kwargs" not in seen[1]
+        assert (tmp_path / "out.png").read_bytes().startswith(b"\x89PNG")
+
     def test_saves_a_file_without_dpi(self, tmp_path: Path):
         saf = SingleAxisFigure.new(tag="t")
         saf.ax.plot([0, 1], [0, 1])
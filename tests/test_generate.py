@@ -5,7 +5,12 @@ from pathlib import Path
 import pytest
 
 from trendify.base.pen import Pen
-from trendify.generator.generate import generate_records, get_sorted_dirs
+from trendify.generator.generate import (
+    _MAX_CHUNKSIZE,
+    _chunk_size,
+    generate_records,
+    get_sorted_dirs,
+)
 from trendify.plotting.point import Point2D
 from trendify.plotting.trace import Trace2D
 from trendify.progress import ProgressEvent
@@ -25,6 +30,12 @@ def _generator(run_dir: Path):
     ]
 
 
+def _failing_generator(run_dir: Path):
+    if run_dir.name == "3":
+        raise ValueError(f"bad run {run_dir.name}")
+    return _generator(run_dir)
+
+
 def _make_run_dirs(tmp_path: Path, n: int) -> list[Path]:
     dirs = []
     for i in range(n):
@@ -83,6 +94,44 @@ class TestGenerateRecordsParallel:
             points = store.get_records_of_type(Point2D)
             assert {p.x for p in points} == {float(i) for i in range(8)}
 
+    def test_every_run_is_written_exactly_once_across_chunks(self, tmp_path: Path):
+        # 40 dirs over 3 workers is several multi-directory chunks, with a short last one.
+        run_dirs = _make_run_dirs(tmp_path, 40)
+        db_path = tmp_path / "trendify.db"
+        events: list[ProgressEvent] = []
+
+        total = generate_records(
+            _generator, run_dirs, db_path, n_procs=3, on_progress=events.append
+        )
+
+        assert total == 80
+        assert sorted(e.detail for e in events) == sorted(str(d) for d in run_dirs)
+        assert [e.completed for e in events] == list(range(1, 41))
+        with RecordStore.open(db_path, readonly=True) as store:
+            run_paths = [p for (p,) in store._conn.execute("SELECT path FROM runs")]
+            assert sorted(run_paths) == sorted(str(d) for d in run_dirs)
+            points = store.get_records_of_type(Point2D)
+            assert sorted(p.x for p in points) == [float(i) for i in range(40)]
+
+    def test_error_inside_a_chunk_propagates(self, tmp_path: Path):
+        run_dirs = _make_run_dirs(tmp_path, 12)
+        db_path = tmp_path / "trendify.db"
+
+        with pytest.raises(ValueError, match="bad run 3"):
+            generate_records(_failing_generator, run_dirs, db_path, n_procs=2)
+
+
+class TestChunkSize:
+    def test_fewer_dirs_than_tasks_still_gets_one_per_chunk(self):
+        assert _chunk_size(total_dirs=3, n_procs=4) == 1
+        assert _chunk_size(total_dirs=0, n_procs=4) == 1
+
+    def test_about_four_chunks_per_worker(self):
+        assert _chunk_size(total_dirs=40, n_procs=2) == 5
+
+    def test_capped_for_large_runs(self):
+        assert _chunk_size(total_dirs=100_000, n_procs=2) == _MAX_CHUNKSIZE
+
 
 class TestOnProgress:
     def test_sequential_reports_one_event_per_run_dir_in_order(self, tmp_path: Path):
@@ -6,6 +6,7 @@ from typing import cast
 import numpy as np
 import plotly.graph_objects as go
 
+from trendify.generator.histogrammer import Histogrammer
 from trendify.plotting.figure import PlotlyFigure
 from trendify.plotting.histogram import HistogramEntry, HistogramStyle
 
@@ -54,6 +55,34 @@ class TestVisibleEdgeForStepHisttype:
     def test_non_step_histtype_is_unaffected(self):
         assert HistogramStyle(histtype="bar", alpha_edge=0).alpha_edge == 0
 
+    def test_coercion_also_applies_when_loading_from_json(self):
+        # Records are read back from the store via JSON, so the coercion has to happen on
+        # that path too, not only on keyword construction.
+        style = HistogramStyle.model_validate_json(
+            '{"histtype": "step", "alpha_edge": 0}'
+        )
+        assert style.alpha_edge == 1
+
+    def test_coercion_applies_to_string_zero(self):
+        style = HistogramStyle.model_validate({"histtype": "step", "alpha_edge": "0"})
+        assert style.alpha_edge == 1
+
+    def test_coercion_applies_to_a_nested_style(self):
+        entry = HistogramEntry.model_validate(
+            {
+                "tags": ["h"],
+                "value": 1.0,
+                "style": {"histtype": "step", "alpha_edge": "0"},
+            }
+        )
+        assert entry.style.alpha_edge == 1
+
+    def test_coerced_style_still_compares_and_hashes_by_value(self):
+        coerced = HistogramStyle(histtype="step", alpha_edge=0)
+        explicit = HistogramStyle(histtype="step", alpha_edge=1.0)
+        assert coerced == explicit
+        assert hash(coerced) == hash(explicit)
+
 
 class TestColorMath:
     def test_rgba_face_uses_alpha_face(self):
@@ -66,15 +95,15 @@ class TestColorMath:
 
     def test_rgba_face_with_rgb_tuple(self):
         # `color` is typed `str` (unlike Pen/Marker), so the tuple branch below is
-        # unreachable through normal construction; bypass validation (via `setattr`, so
-        # this deliberate bypass isn't also a static type error) to exercise it.
-        style = HistogramStyle(color="k", alpha_face=0.5)
-        setattr(style, "color", (1.0, 0.0, 0.0))
+        # unreachable through normal construction; bypass validation (via `model_construct`,
+        # since `HistogramStyle` is frozen and can't be patched after the fact) to exercise it.
+        style = HistogramStyle.model_construct(color=(1.0, 0.0, 0.0), alpha_face=0.5)
         assert _parse_rgba(style.rgba_face) == (255.0, 0.0, 0.0, 0.5)
 
     def test_rgba_face_with_rgba_tuple_uses_tuples_own_alpha(self):
-        style = HistogramStyle(color="k", alpha_face=1.0)
-        setattr(style, "color", (1.0, 0.0, 0.0, 0.75))
+        style = HistogramStyle.model_construct(
+            color=(1.0, 0.0, 0.0, 0.75), alpha_face=1.0
+        )
         assert _parse_rgba(style.rgba_face) == (255.0, 0.0, 0.0, 0.75)
 
     def test_get_face_contrast_color_dark_at_full_opacity(self):
@@ -127,3 +156,14 @@ class TestHistogramEntryAddToPlotly:
         ).add_to_plotly(pf)
 
         assert len(_traces(pf)) == 2
+
+
+class TestHistogrammer:
+    def test_one_series_per_style_in_first_appearance_order(self):
+        entries = [
+            HistogramEntry(tags=["t"], value=v, style=HistogramStyle(label=label))
+            for v, label in [(1.0, "b"), (2.0, "a"), (3.0, "b"), (4.0, "a")]
+        ]
+        saf = Histogrammer.handle_histogram_entries(tag="t", histogram_entries=entries)
+        _, labels = saf.ax.get_legend_handles_labels()
+        assert labels == ["b", "a"]
@@ -6,6 +6,7 @@ from typing import cast
 import numpy as np
 import plotly.graph_objects as go
 import pytest
+from pydantic import ValidationError
 
 from trendify.base.pen import Pen
 from trendify.plotting.figure import PlotlyFigure, SingleAxisFigure
@@ -72,6 +73,39 @@ class TestHasLine:
         assert not Pen(linestyle=None).has_line
 
 
+class TestFrozen:
+    def test_fields_cannot_be_reassigned(self):
+        # Pens are deduplicated in sets and shared between records, so they're frozen: a
+        # mutation would silently change the hash of a pen already sitting in a set.
+        pen = Pen(color="red")
+        with pytest.raises(ValidationError, match="frozen"):
+            pen.color = "blue"  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_model_copy_derives_a_changed_pen(self):
+        pen = Pen(color="red", label="a")
+        recolored = pen.model_copy(update={"color": "blue"})
+        assert (pen.color, recolored.color, recolored.label) == ("red", "blue", "a")
+
+    def test_equal_pens_hash_equal(self):
+        assert len({Pen(color="red"), Pen(color="red"), Pen(color="blue")}) == 2
+
+
+class TestScatterPlotKwargs:
+    def test_returns_a_fresh_mutable_dict(self):
+        pen = Pen(color="red")
+        kwargs = pen.as_scatter_plot_kwargs()
+        kwargs["color"] = "blue"
+        assert pen.as_scatter_plot_kwargs()["color"] == "red"
+
+    def test_trace_marker_kwargs_dont_leak_into_the_pen_kwargs(self):
+        pen = Pen(color="red")
+        trace = Trace2D(
+            tags=["t"], x=np.arange(3.0), y=np.arange(3.0), pen=pen, marker=Marker()
+        )
+        trace.plot_to_ax(SingleAxisFigure.new(tag="t").ax)
+        assert "marker" not in pen.as_scatter_plot_kwargs()
+
+
 class TestTraceMarkersOnly:
     def _trace(self, **pen_kwargs):
         x = np.linspace(0, 1, 10)
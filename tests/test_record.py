@@ -2,7 +2,9 @@
 
 import pytest
 
+from trendify.base import record as record_module
 from trendify.base.record import Record
+from trendify.formats.format2d import PlottableData2D
 from trendify.plotting.point import Point2D
 
 
@@ -27,7 +29,48 @@ class TestRegistry:
         assert "Bogus" not in Record.registry()
 
 
+@pytest.fixture
+def scoped_registry():
+    # Defining a `Record` subclass registers it for the rest of the session, which would leak
+    # into every later registry/`leaf_type_names` lookup. Drop whatever the test registered and
+    # the cached expansions that saw it.
+    before = dict(record_module._record_subclass_registry)
+    yield
+    record_module._record_subclass_registry.clear()
+    record_module._record_subclass_registry.update(before)
+    record_module._leaf_type_names.cache_clear()
+
+
+class TestLeafTypeNames:
+    def test_non_leaf_type_expands_to_its_registered_subclasses(self):
+        names = PlottableData2D.leaf_type_names()
+        assert {"Point2D", "Trace2D", "AxLine", "HistogramEntry"} <= set(names)
+        assert "TableEntry" not in names
+
+    @pytest.mark.usefixtures("scoped_registry")
+    def test_subclass_registered_after_a_lookup_is_picked_up(self):
+        # The expansion is cached, so registering a new subclass has to invalidate it.
+        assert "_LatePoint2D" not in Point2D.leaf_type_names()
+
+        class _LatePoint2D(Point2D):
+            pass
+
+        assert "_LatePoint2D" in Point2D.leaf_type_names()
+
+    def test_subclass_from_an_earlier_test_is_not_left_registered(self):
+        # Runs after the test above (definition order); its `scoped_registry` teardown must
+        # have unregistered `_LatePoint2D` and dropped the cached expansion that included it.
+        assert "_LatePoint2D" not in Record.registry()
+        assert "_LatePoint2D" not in Point2D.leaf_type_names()
+
+
 class TestSetMetadata:
+    def test_default_metadata_is_not_shared_between_records(self):
+        first = Point2D(tags=["t"], x=1.0, y=2.0)
+        second = Point2D(tags=["t"], x=1.0, y=2.0)
+        first.metadata["key"] = "value"
+        assert second.metadata == {}
+
     def test_replaces_metadata_and_returns_self(self):
         point = Point2D(tags=["t"], x=1.0, y=2.0)
         result = point.set_metadata({"key": "value"})
@@ -1,13 +1,15 @@
 """Tests for record store"""
 
 from pathlib import Path
+from typing import cast
 
 import polars as pl
 import pytest
 
+from trendify.base.helpers import Tag
 from trendify.base.pen import Pen
 from trendify.base.record import Record
-from trendify.formats.format2d import Format2D, XYData
+from trendify.formats.format2d import Format2D, PlottableData2D, XYData
 from trendify.formats.table import TableEntry
 from trendify.plotting.axline import AxLine, LineOrientation
 from trendify.plotting.histogram import HistogramEntry
@@ -46,6 +48,27 @@ class TestTagEncoding:
     def test_scalar_and_tuple_dont_collide(self):
         assert encode_tag("a") != encode_tag(("a",))
 
+    def test_int_and_bool_keep_distinct_keys(self):
+        assert encode_tag(1) == "1"
+        assert encode_tag(True) == "true"
+        assert encode_tag(1) == "1"
+
+    def test_equal_tuples_with_different_element_types_keep_distinct_keys(self):
+        # `(1,) == (True,) == (1.0,)`, so nothing keyed on tuple equality may sit in front of
+        # the encoder: the key must not depend on which of them was encoded first.
+        assert encode_tag((1,)) == "[1]"
+        assert encode_tag((True,)) == "[true]"
+        assert encode_tag((1.0,)) == "[1.0]"
+
+    def test_list_tag_encodes_like_the_equivalent_tuple(self):
+        tag = cast(Tag, ["a", "b"])
+        assert encode_tag(tag) == encode_tag(("a", "b"))
+        assert decode_tag(encode_tag(tag)) == ("a", "b")
+
+    def test_nested_list_tag_encodes(self):
+        tag = cast(Tag, ("a", ["b", "c"]))
+        assert encode_tag(tag) == '["a",["b","c"]]'
+
 
 class TestWriteRun:
     def test_write_run_returns_count(self, store: RecordStore, tmp_path: Path):
@@ -167,6 +190,49 @@ class TestGetRecords:
         assert trace.pen.label == "hi"
 
 
+class TestGetRecordsByType:
+    def test_buckets_match_separate_per_type_queries(
+        self, store: RecordStore, tmp_path: Path
+    ):
+        store.write_run(tmp_path / "run1", _sample_records())
+        types = (Point2D, Trace2D, AxLine, HistogramEntry, Format2D)
+        grouped = store.get_records_by_type(types, tag="a")
+        for t in types:
+            assert grouped[t] == store.get_records_of_type(t, tag="a")
+
+    def test_overlapping_types_each_get_their_records(
+        self, store: RecordStore, tmp_path: Path
+    ):
+        store.write_run(tmp_path / "run1", _sample_records())
+        grouped = store.get_records_by_type((XYData, Point2D), tag="a")
+        assert [r.record_type for r in grouped[XYData]] == ["Point2D"]
+        assert [r.record_type for r in grouped[Point2D]] == ["Point2D"]
+
+    def test_types_with_no_matches_get_empty_lists(
+        self, store: RecordStore, tmp_path: Path
+    ):
+        store.write_run(tmp_path / "run1", _sample_records())
+        assert store.get_records_by_type((Format2D,), tag="a") == {Format2D: []}
+
+
+class TestGetTagRecordTypes:
+    def test_matches_per_tag_existence_checks(self, store: RecordStore, tmp_path: Path):
+        store.write_run(tmp_path / "run1", _sample_records())
+        index = store.get_tag_record_types((PlottableData2D, TableEntry))
+        for tag in store.get_tags():
+            types = index.get(tag, set())
+            assert (PlottableData2D in types) == store.has_records(
+                tag=tag, object_type=PlottableData2D
+            )
+            assert (TableEntry in types) == store.has_table_entries(tag)
+
+    def test_tags_without_requested_types_are_left_out(
+        self, store: RecordStore, tmp_path: Path
+    ):
+        store.write_run(tmp_path / "run1", _sample_records())
+        assert store.get_tag_record_types((TableEntry,)) == {"tbl": {TableEntry}}
+
+
 class TestHasRecords:
     def test_matches_get_records_of_type_truthiness(
         self, store: RecordStore, tmp_path: Path
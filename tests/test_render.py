@@ -11,9 +11,11 @@ from trendify.generator.render import render_assets
 from trendify.generator.xy_data_plotter import XYDataPlotter
 from trendify.plotting.histogram import HistogramEntry
 from trendify.plotting.point import Point2D
+from trendify.plotting.scatter import Scatter2D
 from trendify.plotting.trace import Trace2D
 from trendify.progress import ProgressEvent
 from trendify.store.record_store import RecordStore
+from trendify.styling.marker import Marker
 
 
 @pytest.fixture
@@ -63,6 +65,41 @@ class TestRenderAssets:
         assert (out_dir / "scatter.jpg").exists()
         assert (out_dir / "hist.jpg").exists()
 
+    def test_skips_queries_for_record_kinds_a_tag_lacks(
+        self,
+        store: RecordStore,
+        db_path: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        records = [
+            TableEntry(tags=["tbl"], row="r1", col="c1", value=1.0),
+            Point2D(tags=["scatter"], x=1.0, y=2.0),
+        ]
+        store.write_run(tmp_path / "run1", records)
+
+        queried: list[tuple[str, object]] = []
+        get_table_entries = RecordStore.get_table_entries
+        get_records_by_type = RecordStore.get_records_by_type
+
+        def spy_table_entries(self, tag):
+            queried.append(("table", tag))
+            return get_table_entries(self, tag)
+
+        def spy_records_by_type(self, object_types, tag=None):
+            queried.append(("plot", tag))
+            return get_records_by_type(self, object_types, tag=tag)
+
+        monkeypatch.setattr(RecordStore, "get_table_entries", spy_table_entries)
+        monkeypatch.setattr(RecordStore, "get_records_by_type", spy_records_by_type)
+
+        out_dir = tmp_path / "out"
+        render_assets(db_path, out_dir)
+
+        assert sorted(queried) == [("plot", "scatter"), ("table", "tbl")]
+        assert (out_dir / "tbl_melted.csv").exists()
+        assert (out_dir / "scatter.jpg").exists()
+
     def test_tuple_tag_nests_output_path(
         self, store: RecordStore, db_path: Path, tmp_path: Path
     ):
@@ -195,3 +232,35 @@ class TestFormat2DResolution:
 
         assert saf.ax.get_xlim() == (-5.0, 5.0)
         assert saf.ax.get_ylim()[1] > 20.0
+
+
+class TestXYDataPlotter:
+    def test_points_are_scattered_once_per_marker(self):
+        red, blue = Marker(color="red", label="red"), Marker(color="blue", label="blue")
+        points = [
+            Point2D(tags=["tag"], x=float(i), y=float(i), marker=marker)
+            for i, marker in enumerate([red, blue, red, blue, red])
+        ]
+
+        saf = XYDataPlotter.handle_points_and_traces(
+            tag="tag", points=points, traces=[], axlines=[], scatters=[]
+        )
+
+        assert [c.get_label() for c in saf.ax.collections] == ["red", "blue"]
+        assert [len(c.get_offsets()) for c in saf.ax.collections] == [3, 2]
+
+    def test_scatters_are_concatenated_once_per_marker(self):
+        red, blue = Marker(color="red", label="red"), Marker(color="blue", label="blue")
+        scatters = [
+            Scatter2D(tags=["tag"], x=[0.0, 1.0], y=[0.0, 1.0], marker=red),
+            Scatter2D(tags=["tag"], x=[2.0], y=[2.0], marker=blue),
+            Scatter2D(tags=["tag"], x=[3.0, 4.0, 5.0], y=[3.0, 4.0, 5.0], marker=red),
+        ]
+
+        saf = XYDataPlotter.handle_points_and_traces(
+            tag="tag", points=[], traces=[], axlines=[], scatters=scatters
+        )
+
+        assert [c.get_label() for c in saf.ax.collections] == ["red", "blue"]
+        red_offsets = saf.ax.collections[0].get_offsets()
+        assert [float(x) for x in red_offsets[:, 0]] == [0.0, 1.0, 3.0, 4.0, 5.0]
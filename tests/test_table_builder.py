@@ -48,6 +48,19 @@ class TestGetStatsTable:
         assert row["mean"] == 2.0
         assert row["max"] == 3.0
 
+    def test_one_row_per_column_in_pivot_order(self):
+        pivot = pl.DataFrame(
+            {"row": ["r1", "r2"], "b": [1.0, 3.0], "a": [10.0, 10.0], "c": ["x", "y"]}
+        )
+        stats = TableBuilder.get_stats_table(pivot)
+        assert stats is not None
+        assert stats.columns == ["Name", "min", "mean", "max", "sigma3"]
+        assert stats["Name"].to_list() == ["b", "a", "c"]
+        b, a, c = stats.to_dicts()
+        assert b["sigma3"] == pytest.approx(3 * 2**0.5)
+        assert a["sigma3"] == 0.0
+        assert c["mean"] is None
+
     def test_coerces_non_numeric_to_null(self):
         pivot = pl.DataFrame({"row": ["r1", "r2"], "c1": ["hello", "world"]})
         stats = TableBuilder.get_stats_table(pivot)
@@ -83,6 +96,18 @@ class TestProcessTableEntries:
         )
         assert (tmp_path / "group" / "mytag_melted.csv").exists()
 
+    def test_records_created_dirs(self, tmp_path: Path):
+        melted = pl.DataFrame(
+            {"row": ["r1"], "col": ["c1"], "value": [1.0], "unit": [None]}
+        )
+        created_dirs: set[Path] = set()
+        for tag in [("group", "a"), ("group", "b")]:
+            TableBuilder.process_table_entries(
+                tag=tag, melted=melted, out_dir=tmp_path, created_dirs=created_dirs
+            )
+        assert created_dirs == {tmp_path / "group"}
+        assert (tmp_path / "group" / "b_melted.csv").exists()
+
     def test_empty_melted_writes_nothing(self, tmp_path: Path):
         melted = pl.DataFrame(
             schema={"row": pl.Utf8, "col": pl.Utf8, "value": pl.Float64}
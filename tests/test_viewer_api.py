@@ -1,6 +1,7 @@
 """Tests for the viewing API."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,8 @@ from trendify.plotting.point import Point2D
 from trendify.plotting.trace import Trace2D
 from trendify.store.record_store import RecordStore
 from trendify.viewer.app import create_app
+from trendify.viewer.routes import pages
+from trendify.viewer.tag_tree import TagNode, build_tag_tree
 
 
 @pytest.fixture
@@ -64,6 +67,68 @@ class TestIndexPage:
         assert '$dispatch("tag-selected"' in response.text
         assert "@click='$dispatch(" in response.text
 
+    def test_reloads_reuse_the_cached_tag_tree(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        calls = []
+
+        def counting_build(store):
+            calls.append(store)
+            return build_tag_tree(store)
+
+        monkeypatch.setattr(pages, "build_tag_tree", counting_build)
+        assert client.get("/").status_code == 200
+        assert client.get("/").status_code == 200
+        assert len(calls) == 1
+
+    def test_reload_after_the_db_changes_rebuilds_the_tag_tree(
+        self, client: TestClient, db_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # No `/ping` in between: the cache itself notices the regenerated `.db` file.
+        calls = []
+
+        def counting_build(store):
+            calls.append(store)
+            return build_tag_tree(store)
+
+        monkeypatch.setattr(pages, "build_tag_tree", counting_build)
+        assert client.get("/").status_code == 200
+        mtime = db_path.stat().st_mtime
+        os.utime(db_path, (mtime + 10, mtime + 10))
+        assert client.get("/").status_code == 200
+        assert len(calls) == 2
+
+
+class TestTagNodeHelpers:
+    def _tree(self) -> TagNode:
+        leaf = TagNode(
+            key=("a", "b"),
+            label="B",
+            children=[],
+            has_records=True,
+            record_kinds=["table"],
+            size_bytes=1,
+        )
+        return TagNode(
+            key="a",
+            label="A",
+            children=[leaf],
+            has_records=True,
+            record_kinds=["plot"],
+            size_bytes=1,
+        )
+
+    def test_aggregates_over_the_subtree(self):
+        node = self._tree()
+        assert node.search_blob() == "a b"
+        assert node.subtree_kinds() == ["plot", "table"]
+        assert node.record_count() == 2
+
+    def test_memoized_helpers_stay_out_of_serialized_output(self):
+        node = self._tree()
+        node.search_blob()
+        assert set(node.model_dump()) == set(TagNode.model_fields)
+
 
 class TestTagsApi:
     def test_returns_nested_tree(self, client: TestClient):